@@ -1,31 +1,99 @@
 import streamlit as st
 import boto3
 import os
+import pandas as pd
 import time
+from operator import itemgetter
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from clients import BOTO_CONFIG as BASE_CONFIG
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-# 1. Load configuration
-load_dotenv()
+# 1. Load configuration (skip the .env file scan when the environment
+# already carries credentials, e.g. in CI or a container)
+if not os.getenv('AWS_ACCESS_KEY_ID'):
+    load_dotenv()
 
 TAG_CREATED_BY = os.getenv('TAG_CREATED_BY', 'platform-cli')
 TAG_OWNER = os.getenv('TAG_OWNER', 'student')
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 
 # --- HELPERS
-def get_client(service):
-    return boto3.client(
-        service,
+# Shared pooled settings from clients.py (50 keep-alive connections,
+# adaptive retries, TCP keepalive) so the UI and CLI size one pool the
+# same way. parameter_validation is skipped on top: all call shapes here
+# are fixed by the code, so client-side schema checks are pure overhead.
+BOTO_CONFIG = BASE_CONFIG.merge(Config(parameter_validation=False))
+
+@st.cache_resource
+def get_session():
+    """One boto3.Session shared by every client (credential resolution happens once)."""
+    return boto3.Session(
         aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
         region_name=AWS_REGION
     )
 
+@st.cache_resource
+def get_client(service):
+    """Create (once) and reuse a boto3 client across Streamlit reruns."""
+    return get_session().client(service, config=BOTO_CONFIG)
+
+@st.cache_data(ttl=3600)
 def get_latest_ami():
-    """Retrieves the ID of the latest Amazon Linux 2 via SSM."""
+    """Retrieves the ID of the latest Amazon Linux 2 via SSM (cached for 1h)."""
     ssm = get_client('ssm')
     path = '/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-x86_64-gp2'
     return ssm.get_parameter(Name=path)['Parameter']['Value']
 
+# describe_instances is slow enough to dominate EC2 page loads; cache the
+# response briefly per session so widget interactions don't refetch it.
+EC2_CACHE_TTL = 15  # seconds
+
+def describe_my_instances(ec2):
+    """Return our tagged instances, cached in session_state with a short TTL."""
+    cached = st.session_state.get('ec2_instances')
+    if cached and time.time() - cached[0] < EC2_CACHE_TTL:
+        return cached[1]
+    # Paginate so tag-filtered results past the page boundary still show
+    reservations = []
+    for page in ec2.get_paginator('describe_instances').paginate(
+        Filters=[
+            {'Name': 'tag:CreatedBy', 'Values': [TAG_CREATED_BY]},
+            # Every state except 'terminated': filter server-side so dead
+            # instances never travel over the wire
+            {'Name': 'instance-state-name',
+             'Values': ['pending', 'running', 'shutting-down', 'stopping', 'stopped']}
+        ]
+    ):
+        reservations.extend(page['Reservations'])
+    response = {'Reservations': reservations}
+    st.session_state['ec2_instances'] = (time.time(), response)
+    return response
+
+MB = 1024 * 1024
+
+def transfer_config_for(size):
+    """Pick transfer settings by file size: multipart only pays off for big files."""
+    if size < 8 * MB:
+        # Single PUT; raising the threshold avoids needless multipart setup
+        return TransferConfig(multipart_threshold=16 * MB)
+    return TransferConfig(multipart_threshold=8 * MB, multipart_chunksize=8 * MB, max_concurrency=10)
+
+def invalidate_instance_cache():
+    st.session_state.pop('ec2_instances', None)
+
+def apply_instance_state(instance_id, new_state):
+    """Optimistically patch the cached list so the rerun needs no refetch."""
+    cached = st.session_state.get('ec2_instances')
+    if not cached:
+        return
+    for r in cached[1]['Reservations']:
+        for i in r['Instances']:
+            if i['InstanceId'] == instance_id:
+                i['State']['Name'] = new_state
+
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Platform CLI UI", page_icon="☁️", layout="wide")
 st.title("☁️ AWS Self-Service Portal")
@@ -37,7 +105,9 @@ menu = st.sidebar.selectbox("Select Service", ["EC2 (Servers)", "S3 (Storage)",
 # ==========================
 # 🖥️ EC2 SECTION
 # ==========================
-if menu == "EC2 (Servers)":
+@st.fragment
+def render_ec2():
+    """EC2 view. As a fragment, its widgets rerun only this section."""
     st.header("🖥️ Virtual Machines (EC2)")
     ec2 = get_client('ec2')
 
@@ -81,50 +151,57 @@ if menu == "EC2 (Servers)":
                             }]
                         )
                         st.success(f"Instance '{name}' is launching!")
-                        time.sleep(1)
-                        st.rerun() # Refresh page
+                        invalidate_instance_cache()
+                        st.rerun(scope="fragment") # Refresh the fragment (new instance needs a refetch)
                     except Exception as e:
                         st.error(f"Error: {e}")
 
     # --- INSTANCE LIST ---
     st.subheader("My Active Instances")
     try:
-        response = ec2.describe_instances(
-            Filters=[{'Name': 'tag:CreatedBy', 'Values': [TAG_CREATED_BY]}]
-        )
-        
-        data = []
-        for r in response['Reservations']:
-            for i in r['Instances']:
-                if i['State']['Name'] == 'terminated': continue
-                
-                tags = {t['Key']: t['Value'] for t in i.get('Tags', [])}
-                data.append({
-                    "ID": i['InstanceId'],
-                    "Name": tags.get('Name', 'Unknown'),
-                    "State": i['State']['Name'],
-                    "Type": i['InstanceType'],
-                    "IP": i.get('PublicIpAddress', 'No IP')
-                })
-
-        if data:
-            st.dataframe(data, use_container_width=True)
-            
+        response = describe_my_instances(ec2)
+
+        # Flattened comprehensions keep this hot loop free of per-row
+        # rebinding; the tag pass only extracts the one key we display
+        instances = [i for r in response['Reservations'] for i in r['Instances']]
+        rows = [
+            (
+                i['InstanceId'],
+                next((t['Value'] for t in i.get('Tags', []) if t['Key'] == 'Name'), 'Unknown'),
+                i['State']['Name'],
+                i['InstanceType'],
+                i.get('PublicIpAddress', 'No IP')
+            )
+            for i in instances
+        ]
+
+        # Tuples into a typed DataFrame in one shot: st.dataframe converts
+        # to Arrow anyway, so handing it a DataFrame skips a per-dict pass
+        df = pd.DataFrame(rows, columns=["ID", "Name", "State", "Type", "IP"])
+
+        if not df.empty:
+            st.dataframe(df, use_container_width=True)
+
             # Management Controls
-            selected_id = st.selectbox("Select ID to manage", [d['ID'] for d in data])
+            selected_id = st.selectbox("Select ID to manage", df["ID"].tolist())
             c1, c2, c3 = st.columns(3)
+            # After a mutation, patch the cached state and redraw the fragment
+            # immediately instead of sleeping and refetching from AWS
             if c1.button("▶️ Start"):
                 ec2.start_instances(InstanceIds=[selected_id])
                 st.toast(f"Starting {selected_id}...")
-                time.sleep(1); st.rerun()
+                apply_instance_state(selected_id, 'pending')
+                st.rerun(scope="fragment")
             if c2.button("🛑 Stop"):
                 ec2.stop_instances(InstanceIds=[selected_id])
                 st.toast(f"Stopping {selected_id}...")
-                time.sleep(1); st.rerun()
+                apply_instance_state(selected_id, 'stopping')
+                st.rerun(scope="fragment")
             if c3.button("🗑️ Terminate", type="primary"):
                 ec2.terminate_instances(InstanceIds=[selected_id])
                 st.warning(f"Instance {selected_id} is being terminated.")
-                time.sleep(1); st.rerun()
+                apply_instance_state(selected_id, 'shutting-down')
+                st.rerun(scope="fragment")
         else:
             st.info("No active instances found.")
             
@@ -134,7 +211,9 @@ if menu == "EC2 (Servers)":
 # ==========================
 # 🗄️ S3 SECTION
 # ==========================
-elif menu == "S3 (Storage)":
+@st.fragment
+def render_s3():
+    """S3 view. As a fragment, its widgets rerun only this section."""
     st.header("🗄️ File Storage (S3)")
     s3 = get_client('s3')
 
@@ -172,23 +251,43 @@ elif menu == "S3 (Storage)":
                         s3.put_public_access_block(Bucket=b_name, PublicAccessBlockConfiguration={'BlockPublicAcls': True, 'IgnorePublicAcls': True, 'BlockPublicPolicy': True, 'RestrictPublicBuckets': True})
                         
                     st.success(f"Bucket {b_name} created!")
-                    time.sleep(1); st.rerun()
+                    st.rerun(scope="fragment")
                 except Exception as e:
                     st.error(f"Error: {e}")
 
     # --- BUCKET LIST ---
     st.subheader("My Buckets")
     try:
-        resp = s3.list_buckets()
-        my_buckets = []
-        for b in resp['Buckets']:
-            try:
-                tags = s3.get_bucket_tagging(Bucket=b['Name'])
-                tag_dict = {t['Key']: t['Value'] for t in tags['TagSet']}
-                if tag_dict.get('CreatedBy') == TAG_CREATED_BY:
-                    my_buckets.append(b['Name'])
-            except:
-                continue
+        try:
+            # One tag-filtered query instead of a tagging round-trip per bucket
+            tagging = get_client('resourcegroupstaggingapi')
+            my_buckets = []
+            for page in tagging.get_paginator('get_resources').paginate(
+                ResourceTypeFilters=['s3'],
+                TagFilters=[{'Key': 'CreatedBy', 'Values': [TAG_CREATED_BY]}]
+            ):
+                my_buckets.extend(
+                    m['ResourceARN'].split(':::')[-1] for m in page['ResourceTagMappingList']
+                )
+        except Exception:
+            # Fallback (e.g. no tag:GetResources permission): parallel per-bucket lookups
+            names = []
+            for page in s3.get_paginator('list_buckets').paginate():
+                names.extend(b['Name'] for b in page['Buckets'])
+
+            def check_bucket(name):
+                """Return the name if the bucket carries our CreatedBy tag."""
+                try:
+                    tags = s3.get_bucket_tagging(Bucket=name)
+                    tag_dict = {t['Key']: t['Value'] for t in tags['TagSet']}
+                    if tag_dict.get('CreatedBy') == TAG_CREATED_BY:
+                        return name
+                except:
+                    pass
+                return None
+
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                my_buckets = [n for n in pool.map(check_bucket, names) if n]
         
         if my_buckets:
             selected_bucket = st.selectbox("Select bucket to manage", my_buckets)
@@ -199,7 +298,10 @@ elif menu == "S3 (Storage)":
             col_up, col_del = st.columns(2)
             with col_up:
                 if uploaded_file and st.button("Upload File"):
-                    s3.upload_fileobj(uploaded_file, selected_bucket, uploaded_file.name)
+                    s3.upload_fileobj(
+                        uploaded_file, selected_bucket, uploaded_file.name,
+                        Config=transfer_config_for(uploaded_file.size)
+                    )
                     st.success("File uploaded!")
             
             with col_del:
@@ -208,13 +310,20 @@ elif menu == "S3 (Storage)":
                 if st.button("🗑️ Delete Bucket", type="primary"):
                     with st.spinner("Emptying and deleting bucket..."):
                         try:
-                            objs = s3.list_objects_v2(Bucket=selected_bucket)
-                            if 'Contents' in objs:
-                                for obj in objs['Contents']:
-                                    s3.delete_object(Bucket=selected_bucket, Key=obj['Key'])
+                            # Paginate: list_objects_v2 returns at most 1000 keys per page
+                            keys = []
+                            for page in s3.get_paginator('list_objects_v2').paginate(Bucket=selected_bucket):
+                                keys.extend(obj['Key'] for obj in page.get('Contents', []))
+                            if keys:
+                                # Empty the bucket concurrently instead of one blocking call per object
+                                with ThreadPoolExecutor(max_workers=10) as pool:
+                                    list(pool.map(
+                                        lambda key: s3.delete_object(Bucket=selected_bucket, Key=key),
+                                        keys
+                                    ))
                             s3.delete_bucket(Bucket=selected_bucket)
                             st.success("Bucket deleted successfully!")
-                            time.sleep(1); st.rerun()
+                            st.rerun(scope="fragment")
                         except Exception as e:
                             st.error(f"Error deleting bucket: {e}")
                 
@@ -227,7 +336,9 @@ elif menu == "S3 (Storage)":
 # ==========================
 # 🌐 ROUTE53 SECTION
 # ==========================
-elif menu == "Route53 (DNS)":
+@st.fragment
+def render_route53():
+    """Route53 view. As a fragment, its widgets rerun only this section."""
     st.header("🌐 DNS Management (Route53)")
     r53 = get_client('route53')
     
@@ -246,7 +357,7 @@ elif menu == "Route53 (DNS)":
                         AddTags=[{'Key': 'CreatedBy', 'Value': TAG_CREATED_BY}, {'Key': 'Owner', 'Value': TAG_OWNER}]
                     )
                     st.success(f"Zone {domain} created!")
-                    time.sleep(1); st.rerun()
+                    st.rerun(scope="fragment")
                 else:
                     st.error("Zone created but no ID returned.")
             except Exception as e:
@@ -255,28 +366,57 @@ elif menu == "Route53 (DNS)":
     # --- ZONE LIST ---
     st.subheader("My Zones")
     try:
-        zones_resp = r53.list_hosted_zones()
-        my_zones = {}
-        table_data = []
-        
-        all_zones = zones_resp.get('HostedZones', [])
-        
-        for z in all_zones:
-            zid = z['Id'].split('/')[-1]
-            z_name = z['Name']
+        # Paginate: list_hosted_zones caps at 100 zones per page
+        all_zones = []
+        for page in r53.get_paginator('list_hosted_zones').paginate():
+            all_zones.extend(page.get('HostedZones', []))
+
+        def check_zone_batch(batch):
+            """Return the zones in this batch carrying our CreatedBy tag.
+
+            list_tags_for_resources accepts up to 10 zone IDs, so one call
+            covers the whole batch.
+            """
+            ids = [z['Id'].split('/')[-1] for z in batch]
             try:
-                t_resp = r53.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zid)
-                tags = {t['Key']: t['Value'] for t in t_resp['ResourceTagSet']['Tags']}
-                
-                if tags.get('CreatedBy') == TAG_CREATED_BY:
-                    my_zones[z_name] = zid
-                    table_data.append({
-                        "Domain": z_name, 
-                        "ID": zid, 
-                        "Records": z.get('ResourceRecordSetCount', 0)
-                    })
+                t_resp = r53.list_tags_for_resources(ResourceType='hostedzone', ResourceIds=ids)
+                owned_ids = {
+                    ts['ResourceId'] for ts in t_resp['ResourceTagSets']
+                    if any(t['Key'] == 'CreatedBy' and t['Value'] == TAG_CREATED_BY
+                           for t in ts['Tags'])
+                }
+                return [z for z in batch if z['Id'].split('/')[-1] in owned_ids]
             except:
-                continue
+                return []
+
+        try:
+            # One tag-filtered query for all zones, same as the S3 view
+            tagging = get_client('resourcegroupstaggingapi')
+            owned_ids = set()
+            for page in tagging.get_paginator('get_resources').paginate(
+                ResourceTypeFilters=['route53:hostedzone'],
+                TagFilters=[{'Key': 'CreatedBy', 'Values': [TAG_CREATED_BY]}]
+            ):
+                owned_ids.update(
+                    m['ResourceARN'].split('/')[-1] for m in page['ResourceTagMappingList']
+                )
+            owned = [z for z in all_zones if z['Id'].split('/')[-1] in owned_ids]
+        except Exception:
+            # Fallback (e.g. no tag:GetResources permission): batch the tag
+            # lookups (10 zones per call) and fan the batches out —
+            # ceil(N/10) requests instead of N
+            batches = [all_zones[i:i + 10] for i in range(0, len(all_zones), 10)]
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                owned = [z for batch in pool.map(check_zone_batch, batches) for z in batch]
+
+        # One row per owned zone, straight from the source list (zones can
+        # share a Name, so never key rows by it)
+        zone_fields = itemgetter('Id', 'Name')
+        table_data = [
+            {"Domain": name, "ID": zid_raw.split('/')[-1], "Records": z.get('ResourceRecordSetCount', 0)}
+            for z, (zid_raw, name) in ((z, zone_fields(z)) for z in owned)
+        ]
+        my_zones = {row["Domain"]: row["ID"] for row in table_data}
         
         if table_data:
             st.table(table_data)
@@ -309,7 +449,7 @@ elif menu == "Route53 (DNS)":
                         }
                     )
                     st.success(f"Added {full_name} -> {ip}")
-                    time.sleep(1); st.rerun()
+                    st.rerun(scope="fragment")
                 except Exception as e:
                     st.error(f"Error: {e}")
 
@@ -318,40 +458,53 @@ elif menu == "Route53 (DNS)":
             # --- DELETE RECORD LIST ---
             st.write("📋 **Existing A-Records (Delete)**")
             try:
-                rr_resp = r53.list_resource_record_sets(HostedZoneId=target_zone_id)
-                records = rr_resp.get('ResourceRecordSets', [])
+                records = []
+                for page in r53.get_paginator('list_resource_record_sets').paginate(HostedZoneId=target_zone_id):
+                    records.extend(page.get('ResourceRecordSets', []))
                 a_records = [r for r in records if r['Type'] == 'A']
 
                 if a_records:
-                    for rec in a_records:
-                        r_name = rec['Name']
-                        r_val = rec['ResourceRecords'][0]['Value']
-                        r_ttl = rec.get('TTL', 300)
-
-                        rc1, rc2, rc3 = st.columns([3, 2, 1])
-                        rc1.text(r_name)
-                        rc2.text(r_val)
-                        
-                        if rc3.button("🗑️ Delete", key=r_name):
-                            try:
-                                r53.change_resource_record_sets(
-                                    HostedZoneId=target_zone_id,
-                                    ChangeBatch={
-                                        'Changes': [{
-                                            'Action': 'DELETE',
-                                            'ResourceRecordSet': {
-                                                'Name': r_name,
-                                                'Type': 'A',
-                                                'TTL': r_ttl,
-                                                'ResourceRecords': [{'Value': r_val}]
-                                            }
-                                        }]
-                                    }
-                                )
-                                st.warning(f"Deleted {r_name}")
-                                time.sleep(1); st.rerun()
-                            except Exception as e:
-                                st.error(f"Error deleting: {e}")
+                    by_name = {rec['Name']: rec for rec in a_records}
+
+                    # One editable table + one submit instead of a button per
+                    # record: checking rows costs no rerun until submission
+                    rec_df = pd.DataFrame({
+                        "Delete": False,
+                        "Name": list(by_name.keys()),
+                        "Value": [by_name[n]['ResourceRecords'][0]['Value'] for n in by_name],
+                    })
+                    with st.form("delete_records"):
+                        edited = st.data_editor(
+                            rec_df,
+                            disabled=["Name", "Value"],
+                            hide_index=True,
+                            use_container_width=True
+                        )
+                        submitted = st.form_submit_button("🗑️ Delete Selected")
+
+                    to_delete = edited.loc[edited["Delete"], "Name"].tolist() if submitted else []
+                    if to_delete:
+                        try:
+                            # One ChangeBatch for all selected records = one API call
+                            # and one atomic change set instead of N round-trips
+                            r53.change_resource_record_sets(
+                                HostedZoneId=target_zone_id,
+                                ChangeBatch={
+                                    'Changes': [{
+                                        'Action': 'DELETE',
+                                        'ResourceRecordSet': {
+                                            'Name': name,
+                                            'Type': 'A',
+                                            'TTL': by_name[name].get('TTL', 300),
+                                            'ResourceRecords': by_name[name]['ResourceRecords']
+                                        }
+                                    } for name in to_delete]
+                                }
+                            )
+                            st.warning(f"Deleted {len(to_delete)} record(s)")
+                            st.rerun(scope="fragment")
+                        except Exception as e:
+                            st.error(f"Error deleting: {e}")
                 else:
                     st.info("No A-records found in this zone.")
 
@@ -365,7 +518,7 @@ elif menu == "Route53 (DNS)":
                 try:
                     r53.delete_hosted_zone(Id=target_zone_id)
                     st.success(f"Zone {target_zone_name} deleted successfully!")
-                    time.sleep(1); st.rerun()
+                    st.rerun(scope="fragment")
                 except Exception as e:
                     st.error(f"Error: {e} (Hint: Delete all custom A-records first!)")
 
@@ -373,4 +526,12 @@ elif menu == "Route53 (DNS)":
             st.info("No zones found (checked tags).")
             
     except Exception as e:
-        st.error(f"Error loading zones: {e}")
\ No newline at end of file
+        st.error(f"Error loading zones: {e}")
+
+# Dispatch the selected service view
+if menu == "EC2 (Servers)":
+    render_ec2()
+elif menu == "S3 (Storage)":
+    render_s3()
+elif menu == "Route53 (DNS)":
+    render_route53()
\ No newline at end of file
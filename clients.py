@@ -0,0 +1,58 @@
+import os
+import threading
+from botocore.config import Config
+
+# One Config shared by every client: pool sized for threaded fan-outs and
+# multipart uploads, adaptive retries so throttling backs off client-side
+# instead of stacking blind exponential waits
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True
+)
+
+# Credentials come straight from the environment (.env), so botocore's
+# fallback probe of the EC2 metadata endpoint can only ever stall for
+# seconds on machines that aren't EC2. Disable it when keys are explicit.
+if os.getenv('AWS_ACCESS_KEY_ID'):
+    os.environ.setdefault('AWS_EC2_METADATA_DISABLED', 'true')
+
+# Session and client construction are not thread-safe in boto3, and the
+# prewarm thread in main.py runs concurrently with the command thread —
+# serialize construction so both get the same objects. RLock because
+# get_client() builds the session inside its own critical section.
+_lock = threading.RLock()
+_session = None
+_clients = {}
+
+def get_session():
+    """Return the shared boto3.Session (credentials resolved once per process)."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                # Deferred: importing boto3 loads all of botocore (~200 ms
+                # cold), which --help and error paths never need
+                import boto3
+                _session = boto3.Session(
+                    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                    region_name=os.getenv('AWS_REGION')
+                )
+    return _session
+
+def get_client(service):
+    """Return the process-wide client for an AWS service (built once, reused).
+
+    Client construction is expensive (service model load, endpoint
+    resolution, TLS pool setup), so each service gets exactly one client
+    whose keep-alive connections persist across calls.
+    """
+    client = _clients.get(service)
+    if client is None:
+        with _lock:
+            client = _clients.get(service)
+            if client is None:
+                client = get_session().client(service, config=BOTO_CONFIG)
+                _clients[service] = client
+    return client
@@ -1,6 +1,6 @@
 import click
-import boto3
 import os
+from clients import get_client
 
 # Load tags from environment variables
 TAG_CREATED_BY = os.getenv('TAG_CREATED_BY', 'platform-cli')
@@ -14,26 +14,27 @@ MAX_INSTANCES = 2
 SSM_AMI_PATH = '/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-x86_64-gp2'
 
 def get_ec2_client():
-    return boto3.client(
-        'ec2',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
+    return get_client('ec2')
 
 def get_latest_ami():
     """Retrieves the ID of the latest Linux AMI via SSM."""
-    ssm = boto3.client(
-        'ssm',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
+    ssm = get_client('ssm')
     # Request parameter from AWS by path
     response = ssm.get_parameter(Name=SSM_AMI_PATH)
     ami_id = response['Parameter']['Value']
     return ami_id
 
+def get_owned_instances(ec2_client, instance_ids):
+    """Return the subset of instance_ids we manage, using a single describe call."""
+    response = ec2_client.describe_instances(InstanceIds=list(instance_ids))
+    owned = set()
+    for r in response['Reservations']:
+        for i in r['Instances']:
+            tags = {t['Key']: t['Value'] for t in i.get('Tags', [])}
+            if tags.get('CreatedBy') == TAG_CREATED_BY:
+                owned.add(i['InstanceId'])
+    return owned
+
 @click.group()
 def ec2():
     """Manage EC2 virtual machines."""
@@ -98,20 +99,26 @@ def create(instance_type, key_name, name):
     except Exception as e:
         click.echo(f"AWS Error: {e}", err=True)
 
-@ec2.command()
-def list():
+# Named explicitly: a module-level `def list()` would shadow the builtin
+# that the bulk commands below rely on
+@ec2.command(name='list')
+def list_instances():
     """List our instances."""
     ec2_client = get_ec2_client()
-    
-    response = ec2_client.describe_instances(
+
+    # Paginate: tag-filtered describe_instances responses truncate at the
+    # page boundary
+    reservations = []
+    for page in ec2_client.get_paginator('describe_instances').paginate(
         Filters=[{'Name': 'tag:CreatedBy', 'Values': [TAG_CREATED_BY]}]
-    )
+    ):
+        reservations.extend(page['Reservations'])
 
     click.echo(f"{'ID':<20} {'Name':<20} {'State':<10} {'Type':<10} {'Public IP'}")
     click.echo("-" * 75)
-    
+
     found = False
-    for r in response['Reservations']:
+    for r in reservations:
         for i in r['Instances']:
             if i['State']['Name'] == 'terminated':
                 continue
@@ -126,60 +133,55 @@ def list():
         click.echo("No active instances found.")
 
 @ec2.command()
-@click.argument('instance_id')
-def stop(instance_id):
-    """Stop an instance."""
+@click.argument('instance_ids', nargs=-1, required=True)
+def stop(instance_ids):
+    """Stop one or more instances."""
     ec2_client = get_ec2_client()
     try:
-        response = ec2_client.describe_instances(InstanceIds=[instance_id])
-        instance = response['Reservations'][0]['Instances'][0]
-        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-        
-        if tags.get('CreatedBy') != TAG_CREATED_BY:
-            click.echo(f"❌ Error: Instance {instance_id} is not managed by platform-cli!", err=True)
+        # One describe call covers every requested instance
+        owned = get_owned_instances(ec2_client, instance_ids)
+        rejected = [i for i in instance_ids if i not in owned]
+        if rejected:
+            click.echo(f"❌ Error: {', '.join(rejected)} not managed by platform-cli!", err=True)
             return
 
-        ec2_client.stop_instances(InstanceIds=[instance_id])
-        click.echo(f"🛑 Stopping {instance_id}...")
+        ec2_client.stop_instances(InstanceIds=list(instance_ids))
+        click.echo(f"🛑 Stopping {', '.join(instance_ids)}...")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
 @ec2.command()
-@click.argument('instance_id')
-def start(instance_id):
-    """Start an instance."""
+@click.argument('instance_ids', nargs=-1, required=True)
+def start(instance_ids):
+    """Start one or more instances."""
     ec2_client = get_ec2_client()
     try:
-        response = ec2_client.describe_instances(InstanceIds=[instance_id])
-        instance = response['Reservations'][0]['Instances'][0]
-        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-        
-        if tags.get('CreatedBy') != TAG_CREATED_BY:
-            click.echo(f"❌ Error: Instance {instance_id} is not managed by platform-cli!", err=True)
+        owned = get_owned_instances(ec2_client, instance_ids)
+        rejected = [i for i in instance_ids if i not in owned]
+        if rejected:
+            click.echo(f"❌ Error: {', '.join(rejected)} not managed by platform-cli!", err=True)
             return
 
-        ec2_client.start_instances(InstanceIds=[instance_id])
-        click.echo(f"▶️ Starting {instance_id}...")
+        ec2_client.start_instances(InstanceIds=list(instance_ids))
+        click.echo(f"▶️ Starting {', '.join(instance_ids)}...")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
 @ec2.command()
-@click.argument('instance_id')
-def terminate(instance_id):
-    """TERMINATE an instance permanently."""
+@click.argument('instance_ids', nargs=-1, required=True)
+def terminate(instance_ids):
+    """TERMINATE one or more instances permanently."""
     ec2_client = get_ec2_client()
     try:
-        response = ec2_client.describe_instances(InstanceIds=[instance_id])
-        instance = response['Reservations'][0]['Instances'][0]
-        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-        
-        if tags.get('CreatedBy') != TAG_CREATED_BY:
-            click.echo(f"❌ Error: Instance {instance_id} is not managed by platform-cli!", err=True)
+        owned = get_owned_instances(ec2_client, instance_ids)
+        rejected = [i for i in instance_ids if i not in owned]
+        if rejected:
+            click.echo(f"❌ Error: {', '.join(rejected)} not managed by platform-cli!", err=True)
             return
 
-        click.echo(f"⚠️  TERMINATING {instance_id}. Data will be lost.")
+        click.echo(f"⚠️  TERMINATING {', '.join(instance_ids)}. Data will be lost.")
         if click.confirm('Are you sure?'):
-            ec2_client.terminate_instances(InstanceIds=[instance_id])
-            click.echo("✅ Instance terminated.")
+            ec2_client.terminate_instances(InstanceIds=list(instance_ids))
+            click.echo("✅ Instance(s) terminated.")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
\ No newline at end of file
@@ -1,12 +1,30 @@
 import os
+import threading
 from dotenv import load_dotenv
-load_dotenv()
+# Skip the .env file scan when the environment already carries credentials
+if not os.getenv('AWS_ACCESS_KEY_ID'):
+    load_dotenv()
 import click
-import boto3
+from clients import get_client, get_session
 from ec2 import ec2
 from s3 import s3
 from route53 import route53
 
+def _prewarm_clients():
+    """Build the shared session and service clients ahead of the first call.
+
+    Loading botocore's service models takes a noticeable fraction of a
+    second per service; doing it in a daemon thread while click parses
+    the command line hides that latency from the first AWS call.
+    """
+    try:
+        for service in ('ec2', 's3', 'route53'):
+            get_client(service)
+    except Exception:
+        pass  # warm-up is best-effort; real calls will surface any error
+
+threading.Thread(target=_prewarm_clients, daemon=True).start()
+
 @click.group()
 def cli():
     """AWS Resource Management CLI Tool."""
@@ -15,12 +33,8 @@ def cli():
 @cli.command()
 def info():
     """Verify AWS connection and current configuration."""
-    session = boto3.Session(
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
-    
+    session = get_session()
+
     try:
         # Call STS (Security Token Service) to check identity
         sts = session.client('sts')
@@ -1,19 +1,14 @@
 import click
-import boto3
 import os
 import time
+from clients import get_client
 
 # Load tags from environment variables
 TAG_CREATED_BY = os.getenv('TAG_CREATED_BY', 'platform-cli')
 TAG_OWNER = os.getenv('TAG_OWNER', 'student')
 
 def get_route53_client():
-    return boto3.client(
-        'route53',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
+    return get_client('route53')
 
 @click.group()
 def route53():
@@ -52,6 +47,25 @@ def create_zone(domain_name):
     except Exception as e:
         click.echo(f"AWS Error: {e}", err=True)
 
+def _owned_zone_ids():
+    """Zone IDs carrying our CreatedBy tag, via one server-side tag query.
+
+    Returns None when the Resource Groups Tagging API is unavailable
+    (e.g. no tag:GetResources permission) so callers can fall back to
+    per-zone tag lookups.
+    """
+    try:
+        tagging = get_client('resourcegroupstaggingapi')
+        owned = set()
+        for page in tagging.get_paginator('get_resources').paginate(
+            ResourceTypeFilters=['route53:hostedzone'],
+            TagFilters=[{'Key': 'CreatedBy', 'Values': [TAG_CREATED_BY]}]
+        ):
+            owned.update(m['ResourceARN'].split('/')[-1] for m in page['ResourceTagMappingList'])
+        return owned
+    except Exception:
+        return None
+
 # List zones
 @route53.command()
 def list():
@@ -61,15 +75,22 @@ def list():
         response = client.list_hosted_zones()
         click.echo(f"{'Zone ID':<20} {'Name':<25} {'Records'}")
         click.echo("-" * 60)
-        
+
+        # One tag-filtered query instead of a tag lookup per zone
+        owned_ids = _owned_zone_ids()
+
         found = False
         for zone in response['HostedZones']:
             zone_id = zone['Id'].split('/')[-1]
             try:
-                tags_resp = client.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
-                tags = {t['Key']: t['Value'] for t in tags_resp['ResourceTagSet']['Tags']}
-                
-                if tags.get('CreatedBy') == TAG_CREATED_BY:
+                if owned_ids is not None:
+                    is_ours = zone_id in owned_ids
+                else:
+                    tags_resp = client.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
+                    tags = {t['Key']: t['Value'] for t in tags_resp['ResourceTagSet']['Tags']}
+                    is_ours = tags.get('CreatedBy') == TAG_CREATED_BY
+
+                if is_ours:
                     found = True
                     click.echo(f"{zone_id:<20} {zone['Name']:<25} {zone['ResourceRecordSetCount']}")
                     records_resp = client.list_resource_record_sets(HostedZoneId=zone_id)
@@ -1,19 +1,59 @@
 import click
-import boto3
+import json
 import os
+import pathlib
+import sys
 from botocore.exceptions import ClientError
+from clients import get_client
+from concurrent.futures import ThreadPoolExecutor
 
-# Load tags from environment variables
-TAG_CREATED_BY = os.getenv('TAG_CREATED_BY', 'platform-cli')
+# Load tags from environment variables (interned: the CreatedBy value is
+# compared against every bucket's tags, so make the pointer check explicit)
+TAG_CREATED_BY = sys.intern(os.getenv('TAG_CREATED_BY', 'platform-cli'))
 TAG_OWNER = os.getenv('TAG_OWNER', 'student')
 
+# Resolve the region once: us-east-1 rejects an explicit
+# LocationConstraint, every other region requires one
+AWS_REGION = os.getenv('AWS_REGION') or 'us-east-1'
+CREATE_BUCKET_KWARGS = {} if AWS_REGION == 'us-east-1' else {
+    'CreateBucketConfiguration': {'LocationConstraint': AWS_REGION}
+}
+
+# Identical for every bucket we create; build the nested payload once
+TAGGING_PAYLOAD = {
+    'TagSet': [
+        {'Key': 'CreatedBy', 'Value': TAG_CREATED_BY},
+        {'Key': 'Owner', 'Value': TAG_OWNER}
+    ]
+}
+
+# Output templates built once; formatting in the commands is then a
+# single .format per line and list() flushes one write, not one per row
+LIST_HEADER = f"{'Bucket Name':<40} {'Creation Date'}\n" + "-" * 65
+BUCKET_ROW = "{:<40} {}"
+UPLOADING_MSG = "⬆️ Uploading '{}'..."
+
+MB = 1024 * 1024
+
+# Large uploads go as 25 MB parts on 10 threads instead of one serial
+# stream. Built lazily like the session in clients.py, so importing this
+# module (e.g. for --help) never pulls in boto3.
+_transfer_config = None
+
+def get_transfer_config():
+    global _transfer_config
+    if _transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+        _transfer_config = TransferConfig(
+            multipart_threshold=8 * MB,
+            multipart_chunksize=25 * MB,
+            max_concurrency=10,
+            use_threads=True
+        )
+    return _transfer_config
+
 def get_s3_client():
-    return boto3.client(
-        's3',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
+    return get_client('s3')
 
 @click.group()
 def s3():
@@ -28,7 +68,6 @@ def create(bucket_name, public):
     """Create a new S3 bucket."""
     bucket_name = bucket_name.lower()
     s3_client = get_s3_client()
-    region = os.getenv('AWS_REGION')
 
     if public:
         click.echo(f"⚠️  WARNING: You are about to make bucket '{bucket_name}' PUBLIC.")
@@ -37,67 +76,108 @@ def create(bucket_name, public):
             return
 
     try:
-        if region == 'us-east-1':
-            s3_client.create_bucket(Bucket=bucket_name)
-        else:
-            s3_client.create_bucket(
+        s3_client.create_bucket(Bucket=bucket_name, **CREATE_BUCKET_KWARGS)
+
+        # The post-create setup calls are independent of each other, so
+        # issue them concurrently and only report once both have landed
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(
+                s3_client.put_bucket_tagging,
                 Bucket=bucket_name,
-                CreateBucketConfiguration={'LocationConstraint': region}
-            )
-
-        # APPLY TAGS FROM ENV VARIABLES
-        s3_client.put_bucket_tagging(
-            Bucket=bucket_name,
-            Tagging={
-                'TagSet': [
-                    {'Key': 'CreatedBy', 'Value': TAG_CREATED_BY},
-                    {'Key': 'Owner', 'Value': TAG_OWNER}
-                ]
-            }
-        )
+                Tagging=TAGGING_PAYLOAD
+            )]
+            if public:
+                futures.append(pool.submit(s3_client.delete_public_access_block, Bucket=bucket_name))
+            for future in futures:
+                future.result()  # surface any failure before the success line
 
         if public:
-            s3_client.delete_public_access_block(Bucket=bucket_name)
             click.echo(f"🔓 Bucket '{bucket_name}' created (Public).")
         else:
-            s3_client.put_public_access_block(
-                Bucket=bucket_name,
-                PublicAccessBlockConfiguration={
-                    'BlockPublicAcls': True, 'IgnorePublicAcls': True,
-                    'BlockPublicPolicy': True, 'RestrictPublicBuckets': True
-                }
-            )
+            # Since April 2023 new buckets block all public access by
+            # default, so no explicit PublicAccessBlock PUT is needed
             click.echo(f"🔒 Bucket '{bucket_name}' created (Private).")
 
     except ClientError as e:
         click.echo(f"AWS Error: {e}", err=True)
 
+# Error codes meaning "this bucket just isn't ours to read" — safe to treat
+# as having no tags. Anything else (SlowDown, expired credentials, ...)
+# must surface instead of being silently retried per bucket.
+SKIPPABLE_TAGGING_ERRORS = {'NoSuchTagSet', 'NoSuchBucket', 'AccessDenied'}
+
+def _echo_bucket_table(buckets, as_json=False):
+    """Print the bucket table (or NDJSON for scripts) with a single stdout write."""
+    if as_json:
+        # One JSON object per line: machine-readable, pipes into jq, and
+        # skips the padded-datetime formatting of the table path entirely
+        if buckets:
+            click.echo("\n".join(
+                json.dumps({"name": b['Name'], "created": b['CreationDate'].isoformat()})
+                for b in buckets
+            ))
+        return
+    lines = [LIST_HEADER]
+    lines.extend(BUCKET_ROW.format(b['Name'], b['CreationDate']) for b in buckets)
+    if not buckets:
+        lines.append("No buckets found.")
+    click.echo("\n".join(lines))
+
+def _bucket_is_ours(s3_client, bucket_name):
+    """True if the bucket carries our CreatedBy tag.
+
+    Scans the TagSet directly with an early exit instead of building a
+    throwaway dict per bucket; expected per-bucket errors mean "not ours".
+    """
+    try:
+        tag_set = s3_client.get_bucket_tagging(Bucket=bucket_name)['TagSet']
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in SKIPPABLE_TAGGING_ERRORS:
+            return False
+        raise
+    return any(t['Key'] == 'CreatedBy' and t['Value'] == TAG_CREATED_BY for t in tag_set)
+
 # List Buckets
 @s3.command()
-def list():
+@click.option('--prefix', default=None,
+              help='Filter by bucket-name prefix instead of tags (faster, '
+                   'but trusts the naming convention).')
+@click.option('--json', 'as_json', is_flag=True,
+              help='Emit one JSON object per bucket (NDJSON) for scripting.')
+def list(prefix, as_json):
     """List ONLY our buckets."""
     s3_client = get_s3_client()
     try:
-        response = s3_client.list_buckets()
-        click.echo(f"{'Bucket Name':<40} {'Creation Date'}")
-        click.echo("-" * 65)
-        
-        found = False
-        for bucket in response['Buckets']:
-            name = bucket['Name']
-            try:
-                tags_resp = s3_client.get_bucket_tagging(Bucket=name)
-                tags = {t['Key']: t['Value'] for t in tags_resp['TagSet']}
-                
-                # Compare with environment variable
-                if tags.get('CreatedBy') == TAG_CREATED_BY:
-                    found = True
-                    click.echo(f"{name:<40} {bucket['CreationDate']}")
-            except ClientError:
-                continue
-
-        if not found:
-            click.echo("No buckets found.")
+        # Paginate so accounts past the page limit are listed in full
+        buckets = []
+        for page in s3_client.get_paginator('list_buckets').paginate():
+            buckets.extend(page['Buckets'])
+
+        if prefix is not None:
+            # Fast path: name-convention filter, zero tag lookups
+            mine = [b for b in buckets if b['Name'].startswith(prefix)]
+            _echo_bucket_table(mine, as_json)
+            return
+
+        try:
+            # Server-side tag filter: one paginated query instead of a
+            # tagging round-trip per bucket
+            tagging = get_client('resourcegroupstaggingapi')
+            owned = set()
+            for page in tagging.get_paginator('get_resources').paginate(
+                ResourceTypeFilters=['s3'],
+                TagFilters=[{'Key': 'CreatedBy', 'Values': [TAG_CREATED_BY]}]
+            ):
+                owned.update(m['ResourceARN'].split(':::')[-1] for m in page['ResourceTagMappingList'])
+            mine = [b for b in buckets if b['Name'] in owned]
+        except ClientError:
+            # Fallback (e.g. no tag:GetResources permission): parallel
+            # per-bucket tagging lookups
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                flags = pool.map(lambda b: _bucket_is_ours(s3_client, b['Name']), buckets)
+            mine = [b for b, ours in zip(buckets, flags) if ours]
+
+        _echo_bucket_table(mine, as_json)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
@@ -108,18 +188,66 @@ def list():
 def upload(bucket_name, file_path):
     """Upload a file to a bucket."""
     s3_client = get_s3_client()
-    if not os.path.exists(file_path):
+
+    # A single stat doubles as the existence check and tells us the size
+    # so we can route the transfer before touching the network
+    path = pathlib.Path(file_path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        # Covers missing paths, permission errors, bad path components, ...
         click.echo(f"❌ Error: File '{file_path}' not found.", err=True)
         return
 
+    file_name = path.name
     try:
-        file_name = os.path.basename(file_path)
-        click.echo(f"⬆️ Uploading '{file_name}'...")
-        s3_client.upload_file(file_path, bucket_name, file_name)
+        click.echo(UPLOADING_MSG.format(file_name))
+        if size < 8 * MB:
+            # Small file: one PUT, no TransferManager thread pool spin-up
+            s3_client.put_object(Bucket=bucket_name, Key=file_name, Body=path.read_bytes())
+        else:
+            with open(path, 'rb', buffering=MB) as f:
+                s3_client.upload_fileobj(f, bucket_name, file_name, Config=get_transfer_config())
         click.echo(f"✅ Success! File uploaded.")
     except Exception as e:
         click.echo(f"AWS Error: {e}", err=True)
 
+# Upload Directory
+@s3.command(name='upload-dir')
+@click.argument('bucket_name')
+@click.argument('dir_path')
+@click.option('--workers', default=16, help='Number of concurrent uploads.')
+def upload_dir(bucket_name, dir_path, workers):
+    """Upload every file in a directory concurrently."""
+    s3_client = get_s3_client()
+    root = pathlib.Path(dir_path)
+    if not root.is_dir():
+        click.echo(f"❌ Error: Directory '{dir_path}' not found.", err=True)
+        return
+
+    files = [p for p in root.rglob('*') if p.is_file()]
+    if not files:
+        click.echo("No files to upload.")
+        return
+
+    click.echo(UPLOADING_MSG.format(f"{len(files)} file(s) from {root}"))
+
+    def _upload_one(path):
+        # Keys mirror the layout inside the directory
+        key = path.relative_to(root).as_posix()
+        s3_client.upload_file(str(path), bucket_name, key, Config=get_transfer_config())
+        return key
+
+    # I/O-bound and embarrassingly parallel: bounded worker fan-out over
+    # the shared client, same pattern as the tag fetches in list()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for key in pool.map(_upload_one, files):
+                click.echo(f"   ✅ {key}")
+        click.echo(f"✅ Success! {len(files)} file(s) uploaded.")
+    except Exception as e:
+        click.echo(f"AWS Error: {e}", err=True)
+
 # Delete Bucket
 @s3.command(name='delete')
 @click.argument('bucket_name')
@@ -129,9 +257,8 @@ def delete_bucket(bucket_name):
 
     try:
         tags_resp = s3_client.get_bucket_tagging(Bucket=bucket_name)
-        tags = {t['Key']: t['Value'] for t in tags_resp.get('TagSet', [])}
-        
-        if tags.get('CreatedBy') != TAG_CREATED_BY:
+        if not any(t['Key'] == 'CreatedBy' and t['Value'] == TAG_CREATED_BY
+                   for t in tags_resp.get('TagSet', [])):
             click.echo(f"❌ Error: Bucket '{bucket_name}' is not managed by platform-cli!", err=True)
             return
     except Exception as e:
@@ -141,9 +268,9 @@ def delete_bucket(bucket_name):
     click.echo(f"🗑️ Deleting bucket '{bucket_name}' and all its contents...")
     
     try:
-        objects = s3_client.list_objects_v2(Bucket=bucket_name)
-        if 'Contents' in objects:
-            for obj in objects['Contents']:
+        # Paginate: list_objects_v2 returns at most 1000 keys per page
+        for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=bucket_name):
+            for obj in page.get('Contents', []):
                 s3_client.delete_object(Bucket=bucket_name, Key=obj['Key'])
                 click.echo(f"   🗑️ Deleted file: {obj['Key']}")
                 